@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Result Channel Example: Send structured results over a dedicated fd instead of stdout
+The fd number comes from RESULT_FD, set together with --pass_fd when launching
+nsjail. Each frame is a 4-byte big-endian length followed by a JSON document.
+"""
+
+import json
+import os
+import struct
+
+from system_info import get_cpu_information, get_user_information
+
+def get_result_fd():
+    """Return the result fd from RESULT_FD, or None if there is no channel"""
+    fd = os.environ.get('RESULT_FD')
+    if fd is None:
+        print("❌ RESULT_FD is not set, no result channel for this run")
+        return None
+    try:
+        return int(fd)
+    except ValueError:
+        print(f"❌ RESULT_FD is not a valid fd number: {fd!r}")
+        return None
+
+def send_result(fd, payload):
+    """Write one length-prefixed JSON frame to the result fd"""
+    data = json.dumps(payload).encode('utf-8')
+    frame = memoryview(struct.pack('>I', len(data)) + data)
+    try:
+        # os.write may write less than asked, keep going until the frame is complete
+        while frame:
+            written = os.write(fd, frame)
+            frame = frame[written:]
+        return True
+    except OSError as e:
+        print(f"❌ Result fd {fd} is not available: {e}")
+        return False
+
+def main():
+    print("🚀 Sending results over the result channel")
+
+    fd = get_result_fd()
+    if fd is None:
+        return
+
+    if (send_result(fd, {'user': get_user_information()})
+            and send_result(fd, {'cpu': get_cpu_information()})):
+        print("✅ Results sent!")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
 #!/bin/bash
 
-docker run -it --rm --volume $(pwd)/policy.kafel:/policy.kafel --volume $(pwd)/sandbox.cfg:/sandbox.cfg --volume $(pwd)/examples:/examples --volume $(pwd)/data:/data --name nsjail playground
\ No newline at end of file
+docker run -it --rm -p 8000:8000 --volume $(pwd)/policy.kafel:/policy.kafel --volume $(pwd)/sandbox.cfg:/sandbox.cfg --volume $(pwd)/examples:/examples --volume $(pwd)/data:/data --name nsjail playground
\ No newline at end of file